@@ -1,4 +1,6 @@
+import os
 import random
+import shutil
 from collections import deque
 import numpy as np
 import torch
@@ -18,6 +20,9 @@ class DQNAgent:
         memory_size=100_000,
         batch_size=1024,
         target_update_every=1000,
+        epsilon_start=1.0,
+        epsilon_min=0.01,
+        epsilon_decay=0.995,
         device=None
     ):
         self.state_size = state_size
@@ -36,13 +41,16 @@ class DQNAgent:
         self.optimizer = optim.Adam(self.policy_net.parameters(), lr=lr)
         self.loss_fn = nn.MSELoss()
 
+        self.memory_size = memory_size
         self.memory = deque(maxlen=memory_size)
         self.train_steps = 0
+        self.prefetcher = None  # optional RL.prefetch.BatchPrefetcher
+        self.learner = None  # optional RL.fused_learner.FusedLearner
 
         # epsilon-greedy
-        self.epsilon = 1.0
-        self.epsilon_min = 0.01
-        self.epsilon_decay = 0.995  # decay each episode
+        self.epsilon = epsilon_start
+        self.epsilon_min = epsilon_min
+        self.epsilon_decay = epsilon_decay  # decay each episode
 
     def remember(self, state, action, reward, next_state, done):
         self.memory.append((state, action, reward, next_state, done))
@@ -61,6 +69,16 @@ class DQNAgent:
         if len(self.memory) < self.batch_size:
             return
 
+        if self.prefetcher is not None:
+            with self.prefetcher.batch() as batch:
+                self._learn(batch)
+        else:
+            self._learn(self._sample_batch())
+
+    def _sample_batch(self):
+        if self.learner is not None:
+            return self.learner.sample()
+
         batch = random.sample(self.memory, self.batch_size)
         states, actions, rewards, next_states, dones = zip(*batch)
 
@@ -69,6 +87,20 @@ class DQNAgent:
         rewards_t = torch.tensor(rewards, dtype=torch.float32, device=self.device).unsqueeze(1)
         next_states_t = torch.tensor(np.array(next_states), dtype=torch.float32, device=self.device)
         dones_t = torch.tensor(dones, dtype=torch.float32, device=self.device).unsqueeze(1)
+        return states_t, actions_t, rewards_t, next_states_t, dones_t
+
+    def _learn(self, batch):
+        if self.learner is not None:
+            self.learner.learn(batch)
+        else:
+            self._learn_default(batch)
+
+        self.train_steps += 1
+        if self.train_steps % self.target_update_every == 0:
+            self.target_net.load_state_dict(self.policy_net.state_dict())
+
+    def _learn_default(self, batch):
+        states_t, actions_t, rewards_t, next_states_t, dones_t = batch
 
         # current Q(s,a)
         q_pred = self.policy_net(states_t).gather(1, actions_t)
@@ -84,10 +116,6 @@ class DQNAgent:
         loss.backward()
         self.optimizer.step()
 
-        self.train_steps += 1
-        if self.train_steps % self.target_update_every == 0:
-            self.target_net.load_state_dict(self.policy_net.state_dict())
-
     def end_episode(self):
         self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
 
@@ -97,3 +125,95 @@ class DQNAgent:
     def load(self, path="Models/snake_dqn.pth"):
         self.policy_net.load_state_dict(torch.load(path, map_location=self.device))
         self.target_net.load_state_dict(self.policy_net.state_dict())
+
+    # ---------- Full training-state checkpoint ----------
+    # A checkpoint is a directory: state.pt holds nets, optimizer, epsilon,
+    # counters and RNG states; the replay memory is stored column-wise as
+    # .npy arrays so it is written and read in bulk instead of pickled.
+    MEMORY_COLUMNS = ("states", "actions", "rewards", "next_states", "dones")
+
+    def save_checkpoint(self, path="Models/checkpoint", extra=None):
+        tmp_path = path.rstrip("/\\") + ".tmp"
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+
+        n = len(self.memory)
+        columns = {
+            "states": np.empty((n, self.state_size), dtype=np.float32),
+            "actions": np.empty(n, dtype=np.int64),
+            "rewards": np.empty(n, dtype=np.float64),
+            "next_states": np.empty((n, self.state_size), dtype=np.float32),
+            "dones": np.empty(n, dtype=bool),
+        }
+        if n:
+            states, actions, rewards, next_states, dones = zip(*self.memory)
+            columns["states"][:] = states
+            columns["actions"][:] = actions
+            columns["rewards"][:] = rewards
+            columns["next_states"][:] = next_states
+            columns["dones"][:] = dones
+        for name in self.MEMORY_COLUMNS:
+            np.save(os.path.join(tmp_path, f"memory_{name}.npy"), columns[name])
+
+        torch.save(
+            {
+                "policy_net": self.policy_net.state_dict(),
+                "target_net": self.target_net.state_dict(),
+                "optimizer": self.optimizer.state_dict(),
+                "epsilon": self.epsilon,
+                "train_steps": self.train_steps,
+                "memory_size": self.memory_size,
+                "rng": {
+                    "python": random.getstate(),
+                    "numpy": np.random.get_state(),
+                    "torch": torch.get_rng_state(),
+                    "cuda": torch.cuda.get_rng_state_all() if torch.cuda.is_available() else None,
+                },
+                "extra": extra or {},
+            },
+            os.path.join(tmp_path, "state.pt"),
+        )
+
+        # swap in the finished checkpoint so an interruption never leaves a half-written one:
+        # the old one is renamed aside (not deleted) until the new one is in place
+        old_path = path.rstrip("/\\") + ".old"
+        if os.path.exists(path):
+            if os.path.exists(old_path):
+                shutil.rmtree(old_path)
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        if os.path.exists(old_path):
+            shutil.rmtree(old_path)
+
+    def load_checkpoint(self, path="Models/checkpoint"):
+        """
+        Restores everything save_checkpoint wrote and returns its `extra` dict.
+        """
+        old_path = path.rstrip("/\\") + ".old"
+        if not os.path.exists(path) and os.path.exists(old_path):
+            path = old_path  # interrupted mid-swap; the previous checkpoint is intact
+        ckpt = torch.load(os.path.join(path, "state.pt"), map_location=self.device, weights_only=False)
+        self.policy_net.load_state_dict(ckpt["policy_net"])
+        self.target_net.load_state_dict(ckpt["target_net"])
+        self.optimizer.load_state_dict(ckpt["optimizer"])
+        self.epsilon = ckpt["epsilon"]
+        self.train_steps = ckpt["train_steps"]
+        self.memory_size = ckpt["memory_size"]
+
+        states, actions, rewards, next_states, dones = (
+            np.load(os.path.join(path, f"memory_{name}.npy")) for name in self.MEMORY_COLUMNS
+        )
+        self.memory = deque(
+            zip(states, actions.tolist(), rewards.tolist(), next_states, dones.tolist()),
+            maxlen=self.memory_size,
+        )
+
+        rng = ckpt["rng"]
+        random.setstate(rng["python"])
+        np.random.set_state(rng["numpy"])
+        torch.set_rng_state(rng["torch"])
+        if rng["cuda"] is not None and torch.cuda.is_available():
+            torch.cuda.set_rng_state_all(rng["cuda"])
+
+        return ckpt["extra"]
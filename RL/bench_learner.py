@@ -0,0 +1,80 @@
+import argparse
+import random
+import time
+import numpy as np
+import torch
+
+from RL.agent import DQNAgent
+from RL.fused_learner import FusedLearner
+
+# Microbenchmark: learner updates/sec (sample + gradient step) for the default
+# DQNAgent path vs FusedLearner variants, over a synthetic replay memory.
+
+BATCH_SIZES = (64, 256, 1024, 4096)
+MODES = ("default", "fused", "fused+script", "fused+compile")
+
+
+def make_agent(batch_size: int, memory: list) -> DQNAgent:
+    agent = DQNAgent(batch_size=batch_size, device="cpu")
+    agent.memory.extend(memory)
+    return agent
+
+
+def synthetic_memory(n: int, state_size: int = 11) -> list:
+    rng = np.random.default_rng(0)
+    states = rng.integers(0, 2, size=(n, state_size)).astype(np.float32)
+    next_states = rng.integers(0, 2, size=(n, state_size)).astype(np.float32)
+    actions = rng.integers(0, 3, size=n).tolist()
+    rewards = rng.choice([-100.0, 10.0, -0.8, -1.2], size=n).tolist()
+    dones = (rng.random(n) < 0.05).tolist()
+    return list(zip(states, actions, rewards, next_states, dones))
+
+
+def updates_per_sec(agent: DQNAgent, seconds: float, warmup: int = 10) -> float:
+    for _ in range(warmup):
+        agent.train_step()
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        agent.train_step()
+        n += 1
+    return n / (time.perf_counter() - start)
+
+
+def run(batch_sizes=BATCH_SIZES, modes=MODES, seconds: float = 2.0, memory_size: int = 100_000, threads=None):
+    if threads:
+        torch.set_num_threads(threads)
+    memory = synthetic_memory(memory_size)
+
+    results = {}
+    for b in batch_sizes:
+        for mode in modes:
+            random.seed(0)
+            torch.manual_seed(0)
+            agent = make_agent(b, memory)
+            if mode != "default":
+                compile = {"fused": None, "fused+script": "script", "fused+compile": "compile"}[mode]
+                agent.learner = FusedLearner(agent, compile=compile)
+            results[(b, mode)] = updates_per_sec(agent, seconds)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Learner updates/sec: default vs fused")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(BATCH_SIZES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    results = run(args.batch_sizes, args.modes, args.seconds, threads=args.threads)
+
+    print(f"torch threads: {torch.get_num_threads()}")
+    print(f"{'batch':>6} " + " ".join(f"{m:>15}" for m in args.modes) + "   (updates/sec)")
+    for b in args.batch_sizes:
+        base = results[(b, "default")] if "default" in args.modes else None
+        cells = []
+        for m in args.modes:
+            r = results[(b, m)]
+            cells.append(f"{r:8.0f}" + (f" ({r / base:4.2f}x)" if base else ""))
+        print(f"{b:>6} " + " ".join(f"{c:>15}" for c in cells))
@@ -0,0 +1,54 @@
+import time
+import numpy as np
+
+from core.snake_game import SnakeGame
+from RL.numpy_policy import load_policy
+
+# Headless evaluation: greedy play with a torch-free policy.
+
+
+def run_episode(game: SnakeGame, policy, max_steps: int = 10_000):
+    game.reset()
+    steps = 0
+    while not game.done and steps < max_steps:
+        game.step_action(policy.act(game.get_observation()))
+        steps += 1
+    return game.score, steps, game.stalled
+
+
+def evaluate(policy, num_episodes: int = 100, seed=None, max_steps: int = 10_000, starvation_factor: float = 1.0):
+    # greedy play is deterministic, so a repeated state means an endless cycle
+    game = SnakeGame(detect_loops=True, starvation_factor=starvation_factor, seed=seed)
+    scores, total_steps, stalls = [], 0, 0
+
+    start = time.perf_counter()
+    for _ in range(num_episodes):
+        score, steps, stalled = run_episode(game, policy, max_steps)
+        scores.append(score)
+        total_steps += steps
+        stalls += stalled
+    elapsed = time.perf_counter() - start
+
+    return {
+        "episodes": num_episodes,
+        "mean_score": float(np.mean(scores)),
+        "max_score": int(np.max(scores)),
+        "steps": total_steps,
+        "stalls": stalls,
+        "us_per_step": elapsed / max(1, total_steps) * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    t0 = time.perf_counter()
+    policy = load_policy(sys.argv[1])
+    print(f"Policy loaded in {(time.perf_counter() - t0) * 1e3:.2f} ms")
+
+    episodes = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    stats = evaluate(policy, num_episodes=episodes, seed=0)
+    print(
+        f"Episodes: {stats['episodes']} | Mean: {stats['mean_score']:.2f} | Max: {stats['max_score']} "
+        f"| Steps: {stats['steps']} | Stalls: {stats['stalls']} | {stats['us_per_step']:.1f} us/step"
+    )
@@ -0,0 +1,54 @@
+import argparse
+import os
+import numpy as np
+import torch
+
+from RL.numpy_policy import LAYERS
+
+DTYPES = ("float32", "float16", "int8")
+
+
+def state_dict_to_arrays(state_dict, dtype: str = "float32") -> dict:
+    """
+    Flatten a LinearQNet state_dict into numpy arrays keyed like the state_dict.
+    int8 stores each weight matrix with a per-row float32 scale; biases stay float32.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}, got {dtype!r}")
+
+    arrays = {}
+    for name in LAYERS:
+        w = state_dict[f"{name}.weight"].detach().cpu().numpy().astype(np.float32)
+        b = state_dict[f"{name}.bias"].detach().cpu().numpy().astype(np.float32)
+
+        if dtype == "int8":
+            scale = np.abs(w).max(axis=1) / 127.0
+            scale[scale == 0] = 1.0
+            arrays[f"{name}.weight"] = np.round(w / scale[:, None]).astype(np.int8)
+            arrays[f"{name}.weight_scale"] = scale.astype(np.float32)
+        else:
+            arrays[f"{name}.weight"] = w.astype(dtype)
+        arrays[f"{name}.bias"] = b
+    return arrays
+
+
+def export_policy(pth_path: str, out_path: str, dtype: str = "float32") -> str:
+    """
+    .pth (policy_net state_dict, as written by DQNAgent.save) -> flat .npz.
+    The archive is uncompressed, so loading skips zlib; np.load still reads each
+    member fully (no mmap for .npz), which is fine for a few KB of weights.
+    """
+    state_dict = torch.load(pth_path, map_location="cpu")
+    np.savez(out_path, **state_dict_to_arrays(state_dict, dtype))
+    return out_path if out_path.endswith(".npz") else out_path + ".npz"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export LinearQNet weights for the numpy runtime")
+    parser.add_argument("pth")
+    parser.add_argument("out", nargs="?")
+    parser.add_argument("--dtype", choices=DTYPES, default="float32")
+    args = parser.parse_args()
+
+    out = args.out or os.path.splitext(args.pth)[0] + ".npz"
+    print(f"Exported {export_policy(args.pth, out, args.dtype)} ({args.dtype})")
@@ -0,0 +1,139 @@
+import itertools
+import numpy as np
+
+# The 11-feature observation is binary, so a trained policy is just a function
+# on at most 2**11 inputs. "Compiling" evaluates the network once on every
+# consistent bit pattern and stores the argmax, so play is a table lookup.
+
+NUM_FEATURES = 11
+TABLE_SIZE = 1 << NUM_FEATURES
+BIT_WEIGHTS = (1 << np.arange(NUM_FEATURES)).astype(np.float32)
+
+
+def obs_to_index(obs) -> np.ndarray:
+    """
+    (11,) or (n, 11) observations -> table index (bits read little-endian).
+    """
+    return (np.asarray(obs, dtype=np.float32) @ BIT_WEIGHTS).astype(np.int64)
+
+
+def valid_observations() -> np.ndarray:
+    """
+    Every observation get_observation can produce:
+    3 free danger bits, two mutually exclusive food pairs, one-hot direction.
+    """
+    food_axis = [(0, 0), (1, 0), (0, 1)]
+    directions = np.eye(4, dtype=np.float32)
+
+    rows = []
+    for danger in itertools.product((0, 1), repeat=3):
+        for fx, fy in itertools.product(food_axis, food_axis):
+            for d in directions:
+                rows.append([*danger, *fx, *fy, *d])
+    return np.array(rows, dtype=np.float32)
+
+
+class LookupPolicy:
+    def __init__(self, actions: np.ndarray, q: np.ndarray):
+        self.actions = actions
+        self.q = q
+        self.input_size = NUM_FEATURES
+        self.output_size = q.shape[1]
+
+    @classmethod
+    def load(cls, path: str) -> "LookupPolicy":
+        with np.load(path) as data:
+            return cls(data["actions"], data["q"])
+
+    def save(self, path: str) -> None:
+        np.savez(path, actions=self.actions, q=self.q)
+
+    def _lookup(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        idx = obs_to_index(x)
+        actions = self.actions[idx]
+        missing = actions < 0
+        if np.any(missing):
+            bad = x[missing][0] if x.ndim > 1 else x
+            raise ValueError(f"Observation {bad.astype(int).tolist()} is not in the compiled table")
+        return idx, actions
+
+    def forward(self, x) -> np.ndarray:
+        idx, _ = self._lookup(x)
+        return self.q[idx]
+
+    __call__ = forward
+
+    def act(self, state) -> int:
+        return int(self._lookup(state)[1])
+
+    def act_batch(self, states) -> np.ndarray:
+        return self._lookup(states)[1]
+
+    def predict(self, obs, deterministic=True):
+        return self.act(obs), None
+
+
+def compile_policy(q_fn) -> LookupPolicy:
+    """
+    q_fn: (N, 11) float32 -> (N, num_actions) q-values. Called once on all valid inputs.
+    """
+    obs = valid_observations()
+    q = np.asarray(q_fn(obs), dtype=np.float32)
+    idx = obs_to_index(obs)
+
+    actions = np.full(TABLE_SIZE, -1, dtype=np.int8)
+    actions[idx] = np.argmax(q, axis=1)
+    q_table = np.full((TABLE_SIZE, q.shape[1]), np.nan, dtype=np.float32)
+    q_table[idx] = q
+    return LookupPolicy(actions, q_table)
+
+
+def verify_table(table: LookupPolicy, q_fn) -> int:
+    """
+    Re-run the network one observation at a time and compare with the table.
+    Returns the number of mismatching entries (0 means exact).
+    """
+    mismatches = 0
+    for obs in valid_observations():
+        expected = int(np.argmax(q_fn(obs[None, :])[0]))
+        if table.act(obs) != expected:
+            mismatches += 1
+    return mismatches
+
+
+def _q_fn_from_path(path: str):
+    if path.lower().endswith(".pth"):
+        import torch
+        from RL.model import LinearQNet
+
+        sd = torch.load(path, map_location="cpu")
+        net = LinearQNet(sd["fc1.weight"].shape[1], sd["fc1.weight"].shape[0], sd["fc3.weight"].shape[0])
+        net.load_state_dict(sd)
+        net.eval()
+
+        def q_fn(x):
+            with torch.no_grad():
+                return net(torch.from_numpy(np.ascontiguousarray(x))).numpy()
+        return q_fn
+
+    from RL.numpy_policy import load_policy
+    return load_policy(path).forward
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    src = sys.argv[1]
+    out = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(src)[0] + "_table.npz"
+
+    q_fn = _q_fn_from_path(src)
+    table = compile_policy(q_fn)
+    mismatches = verify_table(table, q_fn)
+    table.save(out)
+
+    n_valid = int((table.actions >= 0).sum())
+    print(f"Compiled {n_valid} observations -> {out} | mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,100 @@
+import numpy as np
+
+# Torch-free runtime for exported LinearQNet weights (see RL/export.py).
+# Only numpy is imported here so the frontend and eval workers can play
+# a trained policy without paying torch's startup time and memory.
+
+LAYERS = ("fc1", "fc2", "fc3")
+
+
+def _dequantize(data, name: str) -> np.ndarray:
+    w = data[f"{name}.weight"]
+    if w.dtype == np.int8:
+        # symmetric per-row int8: w ≈ q * scale[:, None]
+        scale = data[f"{name}.weight_scale"].astype(np.float32)
+        return w.astype(np.float32) * scale[:, None]
+    return w.astype(np.float32)
+
+
+class NumpyQNet:
+    """
+    NumPy forward pass of LinearQNet: relu(fc1) -> relu(fc2) -> fc3.
+    Weights are upcast to float32 once at load time, whatever the stored dtype.
+    """
+    def __init__(self, weights, biases):
+        # keep W^T contiguous so forward is a plain x @ W
+        self.weights = [np.ascontiguousarray(w.T, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.input_size = self.weights[0].shape[0]
+        self.output_size = self.weights[-1].shape[1]
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyQNet":
+        with np.load(path) as data:
+            weights = [_dequantize(data, name) for name in LAYERS]
+            biases = [data[f"{name}.bias"] for name in LAYERS]
+        return cls(weights, biases)
+
+    def forward(self, x) -> np.ndarray:
+        """
+        x: (input_size,) or (batch, input_size) -> q-values of matching rank.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        single = x.ndim == 1
+        if single:
+            x = x[None, :]
+
+        w1, w2, w3 = self.weights
+        b1, b2, b3 = self.biases
+        h = np.maximum(x @ w1 + b1, 0.0)
+        h = np.maximum(h @ w2 + b2, 0.0)
+        q = h @ w3 + b3
+        return q[0] if single else q
+
+    __call__ = forward
+
+    def act(self, state) -> int:
+        return int(np.argmax(self.forward(state)))
+
+    def act_batch(self, states) -> np.ndarray:
+        return np.argmax(self.forward(states), axis=1)
+
+    # SB3-style interface used by the frontend
+    def predict(self, obs, deterministic=True):
+        return self.act(obs), None
+
+
+def load_policy(path: str):
+    """
+    Load an exported .npz: network weights, or a compiled lookup table (RL/lookup.py).
+    """
+    with np.load(path) as data:
+        is_table = "actions" in data.files
+    if is_table:
+        from RL.lookup import LookupPolicy
+        return LookupPolicy.load(path)
+    return NumpyQNet.load(path)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from core.snake_game import SnakeGame
+
+    t0 = time.perf_counter()
+    net = load_policy(sys.argv[1])
+    t1 = time.perf_counter()
+
+    obs = SnakeGame().get_observation()
+    n = 10_000
+    for _ in range(n):
+        net.act(obs)
+    t2 = time.perf_counter()
+
+    batch = np.tile(obs, (4096, 1))
+    net.act_batch(batch)
+    t3 = time.perf_counter()
+
+    print(f"load: {(t1 - t0) * 1e3:.2f} ms")
+    print(f"single decision: {(t2 - t1) / n * 1e6:.2f} us")
+    print(f"batched (4096): {(t3 - t2) * 1e3:.2f} ms")
@@ -0,0 +1,140 @@
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+import numpy as np
+import torch
+
+# Background minibatch assembly for DQNAgent. A worker thread samples the
+# replay memory and fills K preallocated (pinned, when CUDA is available)
+# tensor slots while the learner runs forward/backward on the previous one;
+# torch releases the GIL during the heavy ops, so the two overlap.
+#
+# Batches are sampled from the memory as it was when the worker got to them,
+# so they can be up to K steps stale, and sampling uses the prefetcher's own
+# RNG: training with a prefetcher is not bit-for-bit reproducible.
+
+
+class BatchPrefetcher:
+    def __init__(self, agent, depth: int = 2, seed=None):
+        self.agent = agent
+        self.depth = depth
+        self.rng = random.Random(seed)
+
+        b, s = agent.batch_size, agent.state_size
+        pin = torch.cuda.is_available() and str(agent.device).startswith("cuda")
+        self._non_blocking = pin
+
+        def buf(shape, dtype):
+            t = torch.empty(shape, dtype=dtype)
+            return t.pin_memory() if pin else t
+
+        self._slots = [
+            (
+                buf((b, s), torch.float32),
+                buf((b, 1), torch.int64),
+                buf((b, 1), torch.float32),
+                buf((b, s), torch.float32),
+                buf((b, 1), torch.float32),
+            )
+            for _ in range(depth)
+        ]
+        # per-slot CUDA event marking the end of its async host->device copy
+        self._events = [None] * depth
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for i in range(depth):
+            self._free.put(i)
+
+        self._thread = None
+        self._stop = False
+        self._error = None
+
+        self.batches = 0
+        self.assemble_ns = 0
+        self.wait_ns = 0
+
+    # ---------- worker ----------
+    def _fill(self, slot) -> None:
+        memory = self.agent.memory
+        idx = self.rng.sample(range(len(memory)), self.agent.batch_size)
+        batch = [memory[i] for i in idx]
+        states, actions, rewards, next_states, dones = zip(*batch)
+
+        s_t, a_t, r_t, ns_t, d_t = slot
+        np.stack(states, out=s_t.numpy())
+        a_t.numpy()[:, 0] = actions
+        r_t.numpy()[:, 0] = rewards
+        np.stack(next_states, out=ns_t.numpy())
+        d_t.numpy()[:, 0] = dones
+
+    def _run(self) -> None:
+        while True:
+            i = self._free.get()
+            if self._stop:
+                return
+            t0 = time.perf_counter_ns()
+            try:
+                if self._events[i] is not None:
+                    # the GPU may still be reading this pinned slot
+                    self._events[i].synchronize()
+                self._fill(self._slots[i])
+            except BaseException as e:
+                # hand the error to the learner instead of dying silently
+                self._ready.put(e)
+                return
+            self.assemble_ns += time.perf_counter_ns() - t0
+            self._ready.put(i)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="batch-prefetcher", daemon=True)
+            self._thread.start()
+
+    # ---------- learner side ----------
+    @contextmanager
+    def batch(self):
+        """
+        Yields the next prepared batch; its slot is refilled once the block exits.
+        """
+        if self._error is not None:
+            raise RuntimeError("batch prefetcher worker failed") from self._error
+        self.start()
+        t0 = time.perf_counter_ns()
+        i = self._ready.get()
+        self.wait_ns += time.perf_counter_ns() - t0
+        if isinstance(i, BaseException):
+            self._error = i
+            raise RuntimeError("batch prefetcher worker failed") from i
+
+        device = self.agent.device
+        try:
+            batch = tuple(t.to(device, non_blocking=self._non_blocking) for t in self._slots[i])
+            if self._non_blocking:
+                self._events[i] = torch.cuda.Event()
+                self._events[i].record()
+            yield batch
+        finally:
+            self.batches += 1
+            self._free.put(i)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._stop = True
+            self._free.put(-1)
+            self._thread.join()
+            self._thread = None
+
+    def report(self) -> dict:
+        """
+        hidden: assembly time that overlapped learner compute instead of stalling it.
+        """
+        hidden = max(0, self.assemble_ns - self.wait_ns)
+        return {
+            "batches": self.batches,
+            "assemble_ms": self.assemble_ns / 1e6,
+            "wait_ms": self.wait_ns / 1e6,
+            "hidden_ms": hidden / 1e6,
+            "hidden_frac": hidden / self.assemble_ns if self.assemble_ns else 0.0,
+        }
@@ -0,0 +1,141 @@
+import cProfile
+import functools
+import os
+import pstats
+import time
+
+# Opt-in per-phase timing for the training loop. Nothing here is touched
+# unless a PhaseProfiler is passed to train(): it times phases by wrapping
+# the methods of the live env/agent instances, so the classes themselves
+# carry no timing code and cost nothing when profiling is off.
+
+PHASES = {
+    "advance": ("game", "_advance"),
+    "observation": ("game", "get_observation"),
+    "act": ("agent", "act"),
+    "remember": ("agent", "remember"),
+    "batch": ("agent", "_sample_batch"),
+    "learn": ("agent", "_learn"),
+}
+
+
+class PhaseProfiler:
+    """
+    report_every: print aggregated phase timings every N env steps.
+    cprofile_window / torch_window: (start_step, stop_step) to capture a
+    cProfile or torch.profiler trace into out_dir.
+    """
+    def __init__(self, report_every=1000, cprofile_window=None, torch_window=None, out_dir="profiles"):
+        self.report_every = report_every
+        self.cprofile_window = cprofile_window
+        self.torch_window = torch_window
+        self.out_dir = out_dir
+
+        self.steps = 0
+        self.totals = {}
+        self.counts = {}
+        self._window_start = time.perf_counter_ns()
+        self._cprof = None
+        self._torch_prof = None
+        self._capture_ns = 0  # time spent writing traces, kept out of the report
+
+    # ---------- instrumentation ----------
+    def instrument(self, obj, method_name: str, phase: str) -> None:
+        method = getattr(obj, method_name)
+        totals, counts = self.totals, self.counts
+        totals.setdefault(phase, 0)
+        counts.setdefault(phase, 0)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            t0 = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                totals[phase] += clock() - t0
+                counts[phase] += 1
+
+        setattr(obj, method_name, timed)
+
+    def attach(self, env, agent) -> None:
+        owners = {"game": env.game, "agent": agent}
+        for phase, (owner, method_name) in PHASES.items():
+            self.instrument(owners[owner], method_name, phase)
+        self._window_start = time.perf_counter_ns()
+
+    # ---------- per-step hook ----------
+    def step(self) -> None:
+        self.steps += 1
+        s = self.steps
+
+        if self.cprofile_window:
+            if s == self.cprofile_window[0]:
+                self._cprof = cProfile.Profile()
+                self._cprof.enable()
+            elif s == self.cprofile_window[1] and self._cprof is not None:
+                self._stop_cprofile()
+
+        if self.torch_window:
+            if s == self.torch_window[0]:
+                self._start_torch_profiler()
+            elif s == self.torch_window[1] and self._torch_prof is not None:
+                self._stop_torch_profiler()
+
+        if s % self.report_every == 0:
+            self.report()
+
+    def report(self) -> None:
+        wall = time.perf_counter_ns() - self._window_start - self._capture_ns
+        measured = 0
+        lines = [f"[profile] steps {self.steps - self.report_every + 1}-{self.steps} | wall {wall / 1e6:.1f} ms"]
+        for phase in self.totals:
+            total, count = self.totals[phase], self.counts[phase]
+            measured += total
+            mean_us = total / count / 1e3 if count else 0.0
+            lines.append(
+                f"  {phase:<12} {total / 1e6:9.1f} ms  {count:8d} calls  {mean_us:8.1f} us/call  {total / wall:6.1%}"
+            )
+            self.totals[phase] = 0
+            self.counts[phase] = 0
+        lines.append(f"  {'other':<12} {(wall - measured) / 1e6:9.1f} ms  {(wall - measured) / wall:.1%}")
+        print("\n".join(lines))
+        self._window_start = time.perf_counter_ns()
+        self._capture_ns = 0
+
+    def close(self) -> None:
+        if self._cprof is not None:
+            self._stop_cprofile()
+        if self._torch_prof is not None:
+            self._stop_torch_profiler()
+
+    # ---------- trace capture ----------
+    def _stop_cprofile(self) -> None:
+        self._cprof.disable()
+        t0 = time.perf_counter_ns()
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"cprofile_{self.cprofile_window[0]}_{self.steps}")
+        self._cprof.dump_stats(base + ".prof")
+        with open(base + ".txt", "w") as f:
+            pstats.Stats(self._cprof, stream=f).sort_stats("cumulative").print_stats(40)
+        self._cprof = None
+        print(f"[profile] cProfile written to {base}.prof")
+        self._capture_ns += time.perf_counter_ns() - t0
+
+    def _start_torch_profiler(self) -> None:
+        import torch.profiler
+
+        self._torch_prof = torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU])
+        self._torch_prof.start()
+
+    def _stop_torch_profiler(self) -> None:
+        self._torch_prof.stop()
+        t0 = time.perf_counter_ns()
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"torch_{self.torch_window[0]}_{self.steps}")
+        self._torch_prof.export_chrome_trace(base + ".json")
+        with open(base + ".txt", "w") as f:
+            f.write(self._torch_prof.key_averages().table(sort_by="self_cpu_time_total", row_limit=40))
+        self._torch_prof = None
+        print(f"[profile] torch.profiler trace written to {base}.json")
+        self._capture_ns += time.perf_counter_ns() - t0
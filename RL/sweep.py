@@ -0,0 +1,172 @@
+import argparse
+import csv
+import math
+import multiprocessing as mp
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# Parallel hyperparameter sweep with ASHA-style early stopping.
+# Each config trains in its own worker process. At every rung
+# (min_episodes * eta**k episodes) it reports its rolling score to a shared
+# board and keeps going only if it ranks in the top 1/eta of the scores
+# reported at that rung so far.
+
+AGENT_KEYS = ("lr", "gamma", "hidden_size", "batch_size", "target_update_every", "epsilon_decay", "epsilon_min")
+ENV_KEYS = ("death_reward", "food_reward", "step_reward", "distance_shaping", "stall_reward")
+
+SEARCH_SPACE = {
+    "lr": [3e-4, 1e-3, 3e-3],
+    "gamma": [0.9, 0.95, 0.99],
+    "hidden_size": [64, 128, 256],
+    "batch_size": [256, 512, 1024],
+    "target_update_every": [250, 1000, 4000],
+    "epsilon_decay": [0.99, 0.995, 0.998],
+    "epsilon_min": [0.01, 0.05],
+    "death_reward": [-100.0, -10.0],
+    "food_reward": [10.0, 20.0],
+    "step_reward": [-1.0, -0.1, 0.0],
+    "distance_shaping": [0.0, 0.2],
+    "stall_reward": [-10.0, -100.0],
+}
+
+ROLLING_WINDOW = 50
+
+
+def sample_configs(space: dict, n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [{key: rng.choice(values) for key, values in space.items()} for _ in range(n)]
+
+
+def rung_milestones(min_episodes: int, max_episodes: int, eta: int) -> list:
+    milestones = []
+    r = min_episodes
+    while r < max_episodes:
+        milestones.append(r)
+        r *= eta
+    return milestones
+
+
+def _init_worker(torch_threads: int):
+    import torch
+    torch.set_num_threads(torch_threads)
+
+
+def _should_continue(board, lock, rung: int, rolling: float, eta: int) -> bool:
+    with lock:
+        scores = list(board.get(rung, []))
+        scores.append(rolling)
+        board[rung] = scores
+    rank = sorted(scores, reverse=True).index(rolling)
+    return rank < max(1, math.ceil(len(scores) / eta))
+
+
+def _run_config(config_id: int, config: dict, max_episodes: int, milestones: list, eta: int, board, lock, seed: int):
+    from RL.train import train
+
+    recent = deque(maxlen=ROLLING_WINDOW)
+    pending = deque(milestones)
+    stopped_at = None
+
+    def on_episode(episode, score, agent):
+        nonlocal stopped_at
+        recent.append(score)
+        if pending and episode == pending[0]:
+            pending.popleft()
+            if not _should_continue(board, lock, episode, float(np.mean(recent)), eta):
+                stopped_at = episode
+                return True
+        return False
+
+    start = time.perf_counter()
+    summary = train(
+        num_episodes=max_episodes,
+        agent_kwargs={k: config[k] for k in AGENT_KEYS if k in config},
+        env_kwargs={k: config[k] for k in ENV_KEYS if k in config},
+        save_dir=None,
+        on_episode=on_episode,
+        verbose=False,
+        seed=seed,
+    )
+    return {
+        "config_id": config_id,
+        **config,
+        "episodes": summary["episodes"],
+        "stopped_at": stopped_at or "",
+        "best_score": summary["best_score"],
+        "stalls": summary["stalls"],
+        "rolling_score": round(summary["rolling_score"], 3),
+        "seconds": round(time.perf_counter() - start, 1),
+    }
+
+
+def run_sweep(
+    configs: list,
+    max_episodes: int = 800,
+    min_episodes: int = 50,
+    eta: int = 3,
+    workers: int = None,
+    torch_threads: int = 1,
+    results_path: str = "sweep_results.csv",
+    seed: int = 0,
+) -> list:
+    workers = workers or mp.cpu_count()
+    milestones = rung_milestones(min_episodes, max_episodes, eta)
+
+    ctx = mp.get_context("spawn")
+    with ctx.Manager() as manager:
+        board = manager.dict()
+        lock = manager.Lock()
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=(torch_threads,)
+        ) as pool:
+            futures = [
+                pool.submit(_run_config, i, cfg, max_episodes, milestones, eta, board, lock, seed + i)
+                for i, cfg in enumerate(configs)
+            ]
+            for fut in as_completed(futures):
+                row = fut.result()
+                results.append(row)
+                print(
+                    f"Config {row['config_id']} | Episodes: {row['episodes']} | "
+                    f"Rolling: {row['rolling_score']} | Best: {row['best_score']} | {row['seconds']}s"
+                )
+
+    results.sort(key=lambda r: (r["episodes"], r["rolling_score"]), reverse=True)
+    with open(results_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel DQN hyperparameter sweep")
+    parser.add_argument("--configs", type=int, default=64)
+    parser.add_argument("--max-episodes", type=int, default=800)
+    parser.add_argument("--min-episodes", type=int, default=50)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--torch-threads", type=int, default=1)
+    parser.add_argument("--out", default="sweep_results.csv")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_sweep(
+        sample_configs(SEARCH_SPACE, args.configs, args.seed),
+        max_episodes=args.max_episodes,
+        min_episodes=args.min_episodes,
+        eta=args.eta,
+        workers=args.workers,
+        torch_threads=args.torch_threads,
+        results_path=args.out,
+        seed=args.seed,
+    )
+    print(f"Sweep finished in {time.perf_counter() - start:.1f}s. Best: {results[0]}")
+    print(f"Results written to {args.out}")
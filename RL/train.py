@@ -1,14 +1,40 @@
+import os
+import random
+import time
+from collections import deque
 import numpy as np
-from core.snake_game import SnakeGame 
+import torch
+from core.snake_game import SnakeGame
+from core.shared_board import BoardPublisher
 from RL.agent import DQNAgent
+from RL.prefetch import BatchPrefetcher
+from RL.fused_learner import FusedLearner
 
 
 class SnakeEnv:
     """
     action: 0=left, 1=straight, 2=right
     """
-    def __init__(self):
-        self.game = SnakeGame()
+    def __init__(
+        self,
+        death_reward=-100.0,
+        food_reward=10.0,
+        step_reward=-1.0,
+        distance_shaping=0.2,
+        stall_reward=-10.0,
+        detect_loops=False,
+        starvation_factor=1.0,
+        seed=None,
+    ):
+        # Loop detection is opt-in here: under ε-greedy a repeated state does not
+        # mean a cycle, and random exploration revisits states all the time.
+        # The starvation budget bounds looping policies either way.
+        self.game = SnakeGame(detect_loops=detect_loops, starvation_factor=starvation_factor, seed=seed)
+        self.death_reward = death_reward
+        self.stall_reward = stall_reward
+        self.food_reward = food_reward
+        self.step_reward = step_reward
+        self.distance_shaping = distance_shaping
 
     def reset(self):
         self.game.reset()
@@ -28,30 +54,95 @@ class SnakeEnv:
         new_dist = abs(new_head_x - food_x) + abs(new_head_y - food_y)
 
         # -------- base reward --------
-        if result.done:
-            reward = -100.0
+        if result.stalled:
+            reward = self.stall_reward
+        elif result.done:
+            reward = self.death_reward
         elif result.ate_food:
-            reward = 10.0
+            reward = self.food_reward
         else:
-            reward = -1.0
+            reward = self.step_reward
 
         # -------- distance shaping --------
         # Only apply when alive + not just ate food (keeps rewards stable)
         if (not result.done) and (not result.ate_food):
-            reward += 0.2 if new_dist < prev_dist else -0.2
+            reward += self.distance_shaping if new_dist < prev_dist else -self.distance_shaping
 
         next_state = self.game.get_observation()
-        return next_state, reward, result.done, {"score": result.score}
-
-
-
-def train(num_episodes=2000, save_every=100):
-    env = SnakeEnv()
-    agent = DQNAgent(state_size=11, action_size=3)
+        return next_state, reward, result.done, {"score": result.score, "stalled": result.stalled}
+
+
+
+def train(
+    num_episodes=2000,
+    save_every=100,
+    agent_kwargs=None,
+    env_kwargs=None,
+    save_dir="Models",
+    on_episode=None,
+    verbose=True,
+    seed=None,
+    checkpoint_every=None,
+    checkpoint_path="Models/checkpoint",
+    resume=None,
+    profiler=None,
+    spectate=None,
+    prefetch=0,
+    learner=None,
+):
+    """
+    save_dir=None disables model files (used by RL/sweep.py).
+    on_episode(episode, score, agent) -> True stops training early.
+    checkpoint_every=N writes a full resumable checkpoint every N episodes;
+    resume=<checkpoint dir> continues from one (bit-for-bit when seeded).
+    profiler: optional RL.profiling.PhaseProfiler for per-phase timings.
+    spectate=<name> publishes the live board to shared memory for
+    `python -m frontend.pygame_app --spectate <name>`.
+    prefetch=K assembles the next K minibatches on a background thread
+    (not bit-for-bit reproducible; see RL/prefetch.py).
+    learner: optional kwargs for RL.fused_learner.FusedLearner, e.g. {"compile": "script"}.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+        torch.manual_seed(seed)
+
+    # the game gets its own stream, not a copy of the global `random` the agent
+    # samples ε-greedy actions and minibatches from
+    env_seed = None if seed is None else random.Random(f"env-{seed}").getrandbits(64)
+    env = SnakeEnv(**{"seed": env_seed, **(env_kwargs or {})})
+    agent = DQNAgent(state_size=11, action_size=3, **(agent_kwargs or {}))
+    if profiler is not None:
+        profiler.attach(env, agent)
+    publisher = BoardPublisher(env.game.width, env.game.height, spectate) if spectate else None
+    if learner is not None:
+        agent.learner = FusedLearner(agent, **learner)
+    if prefetch:
+        agent.prefetcher = BatchPrefetcher(agent, depth=prefetch)
 
     best_score = 0
-
-    for episode in range(1, num_episodes + 1):
+    stalls = 0
+    recent_scores = deque(maxlen=50)
+    start_episode = 1
+    episode = 0
+
+    if resume:
+        t0 = time.perf_counter()
+        extra = agent.load_checkpoint(resume)
+        episode = extra["episode"]
+        start_episode = episode + 1
+        best_score = extra["best_score"]
+        stalls = extra.get("stalls", 0)
+        if "env_rng" in extra:  # older checkpoints used the global `random` for food
+            env.game.rng.setstate(extra["env_rng"])
+        recent_scores.extend(extra["recent_scores"])
+        if verbose:
+            print(
+                f"Resumed from {resume} at episode {episode} "
+                f"({len(agent.memory)} transitions, {time.perf_counter() - t0:.2f}s)"
+            )
+
+    for episode in range(start_episode, num_episodes + 1):
         state = env.reset()
         done = False
         score = 0
@@ -60,27 +151,77 @@ def train(num_episodes=2000, save_every=100):
             action = agent.act(state)
             next_state, reward, done, info = env.step(action)
 
-            agent.remember(state, action, reward, next_state, done)
+            # a stall is a time-limit truncation, not a terminal state: it ends the
+            # episode but is stored as non-terminal so the target still bootstraps
+            agent.remember(state, action, reward, next_state, done and not info["stalled"])
             agent.train_step()
 
             state = next_state
             score = info["score"]
 
+            if profiler is not None:
+                profiler.step()
+            if publisher is not None:
+                publisher.publish(env.game.snake, env.game.food, score, episode, agent.epsilon)
+
         agent.end_episode()
+        recent_scores.append(score)
+        stalls += info["stalled"]
 
         if score > best_score:
             best_score = score
-            agent.save("Models/snake_dqn_best.pth")
-
-        if episode % save_every == 0:
-            agent.save("Models/snake_dqn.pth")
-
-        print(
-            f"Episode {episode}/{num_episodes} | Score: {score} | Best: {best_score} | Epsilon: {agent.epsilon:.3f}"
-        )
-
-    agent.save("Models/snake_dqn_final.pth")
-    print("Training finished. Saved model.")
+            if save_dir:
+                agent.save(os.path.join(save_dir, "snake_dqn_best.pth"))
+
+        if save_dir and episode % save_every == 0:
+            agent.save(os.path.join(save_dir, "snake_dqn.pth"))
+
+        if verbose:
+            print(
+                f"Episode {episode}/{num_episodes} | Score: {score} | Best: {best_score} | Epsilon: {agent.epsilon:.3f}"
+                + (" | Stalled" if info["stalled"] else "")
+            )
+
+        if checkpoint_every and episode % checkpoint_every == 0:
+            agent.save_checkpoint(
+                checkpoint_path,
+                extra={
+                    "episode": episode,
+                    "best_score": best_score,
+                    "stalls": stalls,
+                    "recent_scores": list(recent_scores),
+                    "env_rng": env.game.rng.getstate(),
+                },
+            )
+
+        if on_episode is not None and on_episode(episode, score, agent):
+            break
+
+    if profiler is not None:
+        profiler.close()
+    if publisher is not None:
+        publisher.close()
+    prefetch_report = None
+    if agent.prefetcher is not None:
+        agent.prefetcher.close()
+        prefetch_report = agent.prefetcher.report()
+        if verbose:
+            print(
+                f"Prefetch: {prefetch_report['batches']} batches | assembly {prefetch_report['assemble_ms']:.0f} ms "
+                f"| learner waited {prefetch_report['wait_ms']:.0f} ms | hidden {prefetch_report['hidden_frac']:.0%}"
+            )
+    if save_dir:
+        agent.save(os.path.join(save_dir, "snake_dqn_final.pth"))
+    if verbose:
+        print("Training finished. Saved model." if save_dir else "Training finished.")
+
+    return {
+        "episodes": episode,
+        "best_score": best_score,
+        "stalls": stalls,
+        "rolling_score": float(np.mean(recent_scores)) if recent_scores else 0.0,
+        "prefetch": prefetch_report,
+    }
 
 
 if __name__ == "__main__":
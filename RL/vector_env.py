@@ -0,0 +1,103 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from RL.train import SnakeEnv
+
+# Steps many SnakeEnvs in shards on a thread pool. Each env owns its game,
+# RNG and buffers, and each shard writes only its own rows of the output
+# arrays, so no locking is needed. On free-threaded CPython (3.13t+, GIL
+# disabled) the shards run on separate cores without the pickling/IPC of a
+# process pool; with the GIL enabled threads would only add overhead, so the
+# shards are stepped serially on the calling thread instead.
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+class ThreadedVectorEnv:
+    def __init__(self, num_envs: int, num_threads: int = None, seed=None, env_kwargs=None, use_threads=None):
+        """
+        use_threads: None = only when the GIL is disabled; True/False to force.
+        Done envs are reset automatically; their final observation is in info["final_observation"].
+        """
+        self.num_envs = num_envs
+        env_kwargs = dict(env_kwargs or {})
+        if "seed" in env_kwargs:
+            # a shared seed would give every env the same food; use it as the base instead
+            if seed is not None:
+                raise ValueError("pass seed either as seed= or in env_kwargs, not both")
+            seed = env_kwargs.pop("seed")
+        self.envs = [SnakeEnv(seed=None if seed is None else seed + i, **env_kwargs) for i in range(num_envs)]
+
+        self.use_threads = (not gil_enabled()) if use_threads is None else use_threads
+        num_threads = num_threads or min(num_envs, 8)
+        bounds = np.linspace(0, num_envs, num_threads + 1).astype(int)
+        self._shards = [range(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        self._pool = ThreadPoolExecutor(max_workers=len(self._shards)) if self.use_threads else None
+
+        self._obs = np.zeros((num_envs, 11), dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=bool)
+        self._infos = [{} for _ in range(num_envs)]
+
+    def _map(self, fn, *args) -> None:
+        if self._pool is None:
+            for shard in self._shards:
+                fn(shard, *args)
+        else:
+            for f in [self._pool.submit(fn, shard, *args) for shard in self._shards]:
+                f.result()
+
+    def _reset_shard(self, shard) -> None:
+        for i in shard:
+            self._obs[i] = self.envs[i].reset()
+
+    def _step_shard(self, shard, actions) -> None:
+        for i in shard:
+            env = self.envs[i]
+            obs, reward, done, info = env.step(int(actions[i]))
+            if done:
+                info["final_observation"] = obs
+                obs = env.reset()
+            self._obs[i] = obs
+            self._rewards[i] = reward
+            self._dones[i] = done
+            self._infos[i] = info
+
+    def reset(self) -> np.ndarray:
+        self._map(self._reset_shard)
+        return self._obs.copy()
+
+    def step(self, actions):
+        """
+        actions: (num_envs,) -> obs (num_envs, 11), rewards, dones, infos
+        """
+        self._map(self._step_shard, np.asarray(actions))
+        return self._obs.copy(), self._rewards.copy(), self._dones.copy(), list(self._infos)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+if __name__ == "__main__":
+    num_envs, steps = 64, 500
+    rng = np.random.default_rng(0)
+    actions = rng.choice([0, 1, 1, 1, 2], size=(steps, num_envs))
+
+    print(f"Python {sys.version.split()[0]} | GIL enabled: {gil_enabled()}")
+    for use_threads in (False, True):
+        venv = ThreadedVectorEnv(num_envs, seed=0, use_threads=use_threads)
+        venv.reset()
+        start = time.perf_counter()
+        for t in range(steps):
+            venv.step(actions[t])
+        elapsed = time.perf_counter() - start
+        venv.close()
+        mode = "threaded" if use_threads else "serial"
+        print(f"{mode:>8}: {num_envs * steps / elapsed:,.0f} env steps/sec")
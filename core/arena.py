@@ -0,0 +1,338 @@
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+
+from core.snake_game import Pos, UP, DOWN, LEFT, RIGHT
+
+# Multi-snake variant of SnakeGame: M snakes on one board, simultaneous moves,
+# shared food. One occupancy grid, padded with a wall border and stored flat,
+# replaces the per-snake `pos in snake` scans: a cell is an int index, a move
+# is index + DELTA[dir], and a wall is just a negative cell. Heads, tails and
+# directions live in (M,) arrays so movement, collisions and observations are
+# computed for all snakes at once.
+#
+# Each of those array ops costs about a microsecond of fixed numpy overhead,
+# which only pays off once there are enough snakes to share it. Arenas of up
+# to SMALL_ARENA snakes (including the usual 2-4 player match) keep the
+# per-snake state in lists and run the same rules as plain Python loops.
+
+WALL = -1
+SMALL_ARENA = 48
+
+# clockwise, so a right turn is dir + 1 and a left turn is dir - 1
+DIRS = (UP, RIGHT, DOWN, LEFT)
+# action 0=left, 1=straight, 2=right -> new direction id
+TURN = np.array([[(d + a - 1) % 4 for a in range(3)] for d in range(4)], dtype=np.int64)
+# observation column of each direction's one-hot (moving_left=7, right=8, up=9, down=10)
+DIR_COL = np.array([9, 8, 10, 7], dtype=np.int64)
+DIR_COL_LIST = DIR_COL.tolist()
+
+
+@dataclass
+class ArenaStepResult:
+    alive: np.ndarray     # (M,) bool, after this step
+    died: np.ndarray      # (M,) bool, died on this step
+    ate_food: np.ndarray  # (M,) bool
+    scores: np.ndarray    # (M,) int
+    done: bool            # every snake is dead
+
+
+class SnakeArena:
+    def __init__(
+        self,
+        width: int = 20,
+        height: int = 20,
+        num_snakes: int = 2,
+        init_length: int = 3,
+        num_food: int = 1,
+        seed: Optional[int] = None,
+    ):
+        if num_snakes > height:
+            raise ValueError(f"num_snakes={num_snakes} does not fit on a board of height {height}")
+        self.width = width
+        self.height = height
+        self.num_snakes = num_snakes
+        self.init_length = max(2, init_length)
+        self.num_food = num_food
+        self.rng = random.Random(seed)
+
+        self._stride = width + 2
+        self._delta = np.array([dx + dy * self._stride for dx, dy in DIRS], dtype=np.int64)
+        self._delta_list = self._delta.tolist()
+        self._small = num_snakes <= SMALL_ARENA
+        self.reset()
+
+    # ---------- cell <-> position ----------
+    def _cell(self, x: int, y: int) -> int:
+        return (y + 1) * self._stride + (x + 1)
+
+    def _pos(self, cell: int) -> Pos:
+        y, x = divmod(int(cell), self._stride)
+        return (x - 1, y - 1)
+
+    @property
+    def snakes(self) -> List[List[Pos]]:
+        return [[self._pos(c) for c in body] for body in self._bodies]
+
+    @property
+    def food(self) -> List[Pos]:
+        return [self._pos(c) for c in self._food]
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        (height, width) view of the occupancy grid: 0 = empty, i+1 = snake i.
+        """
+        return self._grid.reshape(self.height + 2, self._stride)[1:-1, 1:-1]
+
+    # per-snake state: (M,) arrays, or plain lists on the small-arena path
+    @property
+    def heads(self) -> np.ndarray:
+        return np.asarray(self._heads, dtype=np.int64)
+
+    @property
+    def tails(self) -> np.ndarray:
+        return np.asarray(self._tails, dtype=np.int64)
+
+    @property
+    def directions(self) -> np.ndarray:
+        """
+        Index into DIRS (0=up, 1=right, 2=down, 3=left).
+        """
+        return np.asarray(self._dirs, dtype=np.int64)
+
+    @property
+    def alive(self) -> np.ndarray:
+        return np.asarray(self._alive, dtype=bool)
+
+    @property
+    def scores(self) -> np.ndarray:
+        return np.asarray(self._scores, dtype=np.int64)
+
+    def reset(self) -> ArenaStepResult:
+        m = self.num_snakes
+        grid = np.full((self.height + 2, self._stride), WALL, dtype=np.int16)
+        grid[1:-1, 1:-1] = 0
+        self._grid = grid.reshape(-1)
+        self._food_mask = np.zeros(self._grid.size, dtype=bool)
+        self._food: List[int] = []
+
+        # one row per snake, spread vertically, all heading right from the centre
+        cx = self.width // 2
+        self._bodies: List[deque] = []
+        for i in range(m):
+            y = (i + 1) * self.height // (m + 1)
+            body = deque(self._cell(cx - k, y) for k in range(self.init_length))
+            self._grid[list(body)] = i + 1
+            self._bodies.append(body)
+
+        self._heads = np.array([b[0] for b in self._bodies], dtype=np.int64)
+        self._tails = np.array([b[-1] for b in self._bodies], dtype=np.int64)
+        self._dirs = np.full(m, DIRS.index(RIGHT), dtype=np.int64)
+        self._alive = np.ones(m, dtype=bool)
+        self._scores = np.zeros(m, dtype=np.int64)
+        if self._small:
+            self._heads, self._tails, self._dirs, self._alive, self._scores = (
+                a.tolist() for a in (self._heads, self._tails, self._dirs, self._alive, self._scores)
+            )
+        self.done = False
+
+        self._spawn_food()
+        return self._result(np.zeros(m, dtype=bool), np.zeros(m, dtype=bool))
+
+    def _spawn_food(self) -> None:
+        while len(self._food) < self.num_food:
+            empty = np.flatnonzero((self._grid == 0) & ~self._food_mask)
+            if empty.size == 0:
+                return
+            cell = int(empty[self.rng.randrange(empty.size)])
+            self._food.append(cell)
+            self._food_mask[cell] = True
+
+    # ---------- Relative actions for all snakes ----------
+    def step(self, actions) -> ArenaStepResult:
+        """
+        actions: (M,) of 0=left, 1=straight, 2=right. Dead snakes' actions are ignored.
+        """
+        m = self.num_snakes
+        if self.done:
+            return self._result(np.zeros(m, dtype=bool), np.zeros(m, dtype=bool))
+        if self._small:
+            return self._step_small(actions)
+
+        alive = self._alive
+        self._dirs = np.where(alive, TURN[self._dirs, np.asarray(actions)], self._dirs)
+        new_heads = self._heads + self._delta[self._dirs]
+
+        target = self._grid[new_heads]
+        eats = alive & self._food_mask[new_heads]
+
+        # a tail cell is free to enter if its owner moves without growing
+        vacating = alive & ~eats
+        owner = np.maximum(target, 1) - 1
+        into_free_tail = (target > 0) & vacating[owner] & (self._tails[owner] == new_heads)
+        blocked = (target == WALL) | ((target > 0) & ~into_free_tail)
+
+        # head-to-head: two or more live heads landing on the same cell
+        live_heads = new_heads[alive]
+        head_on = np.zeros(m, dtype=bool)
+        if len(set(live_heads.tolist())) < live_heads.size:
+            cells, counts = np.unique(live_heads, return_counts=True)
+            head_on = alive & np.isin(new_heads, cells[counts > 1])
+
+        died = alive & (blocked | head_on)
+        survivors = alive & ~died
+        ate = eats & survivors
+
+        # tails first (so an entering head isn't erased), then dead bodies, then new heads
+        grid, bodies = self._grid, self._bodies
+        for i in np.flatnonzero(vacating).tolist():
+            grid[bodies[i].pop()] = 0
+        for i in np.flatnonzero(died).tolist():
+            grid[list(bodies[i])] = 0
+            bodies[i].clear()
+        for i in np.flatnonzero(survivors).tolist():
+            bodies[i].appendleft(int(new_heads[i]))
+            self._tails[i] = bodies[i][-1]
+        grid[new_heads[survivors]] = np.flatnonzero(survivors) + 1
+
+        self._heads = np.where(survivors, new_heads, self._heads)
+        self._alive = survivors
+        self._scores += ate
+
+        if ate.any():
+            for cell in new_heads[ate].tolist():
+                self._food.remove(cell)
+                self._food_mask[cell] = False
+            self._spawn_food()
+
+        self.done = not survivors.any()
+        return self._result(died, ate)
+
+    def _step_small(self, actions) -> ArenaStepResult:
+        # step() for small M: the same rules, one snake at a time
+        m = self.num_snakes
+        grid, bodies, food = self._grid, self._bodies, self._food
+        delta, dirs, heads, tails, alive = self._delta_list, self._dirs, self._heads, self._tails, self._alive
+
+        new_heads = list(heads)
+        eats = [False] * m
+        for i, action in enumerate(actions):
+            if alive[i]:
+                dirs[i] = (dirs[i] + int(action) - 1) % 4
+                new_heads[i] = cell = heads[i] + delta[dirs[i]]
+                eats[i] = cell in food
+        live_heads = [new_heads[i] for i in range(m) if alive[i]]
+
+        died = [False] * m
+        for i in range(m):
+            if not alive[i]:
+                continue
+            cell = new_heads[i]
+            target = grid.item(cell)
+            if target == WALL:
+                died[i] = True
+            elif target > 0:
+                # a tail cell is free to enter if its owner moves without growing
+                owner = target - 1
+                died[i] = eats[owner] or tails[owner] != cell
+            if not died[i] and live_heads.count(cell) > 1:
+                died[i] = True  # head-to-head
+
+        # tails first (so an entering head isn't erased), then dead bodies, then new heads
+        for i in range(m):
+            if alive[i] and not eats[i]:
+                grid[bodies[i].pop()] = 0
+        for i in range(m):
+            if died[i]:
+                for cell in bodies[i]:
+                    grid[cell] = 0
+                bodies[i].clear()
+                alive[i] = False
+        ate = [False] * m
+        for i in range(m):
+            if alive[i]:
+                bodies[i].appendleft(new_heads[i])
+                tails[i] = bodies[i][-1]
+                heads[i] = new_heads[i]
+                grid[heads[i]] = i + 1
+                if eats[i]:
+                    ate[i] = True
+                    self._scores[i] += 1
+                    food.remove(heads[i])
+                    self._food_mask[heads[i]] = False
+
+        if any(ate):
+            self._spawn_food()
+        self.done = not any(alive)
+        return self._result(np.array(died), np.array(ate))
+
+    def _result(self, died: np.ndarray, ate: np.ndarray) -> ArenaStepResult:
+        return ArenaStepResult(
+            alive=np.array(self._alive, dtype=bool),
+            died=died,
+            ate_food=ate,
+            scores=np.array(self._scores, dtype=np.int64),
+            done=self.done,
+        )
+
+    # ---------- Observations (same 11-feature layout as SnakeGame) ----------
+    def get_observations(self) -> np.ndarray:
+        """
+        (M, 11) float32, one SnakeGame.get_observation row per snake; food
+        features point at the nearest food. Dead snakes get all-zero rows.
+        """
+        if self._small:
+            return self._observations_small()
+
+        m = self.num_snakes
+        obs = np.zeros((m, 11), dtype=np.float32)
+
+        # (M, 3) cells ahead: straight, left, right
+        turns = TURN[self._dirs][:, [1, 0, 2]]
+        ahead = self._heads[:, None] + self._delta[turns]
+        occ = self._grid[ahead]
+        # the own tail moves away if not eating (matches snake[:-1] in SnakeGame)
+        obs[:, 0:3] = (occ == WALL) | ((occ > 0) & (ahead != self._tails[:, None]))
+
+        if self._food:
+            hy, hx = np.divmod(self._heads, self._stride)
+            fy, fx = np.divmod(np.array(self._food, dtype=np.int64), self._stride)
+            dist = np.abs(hx[:, None] - fx[None, :]) + np.abs(hy[:, None] - fy[None, :])
+            nearest = np.argmin(dist, axis=1)
+            fx, fy = fx[nearest], fy[nearest]
+            obs[:, 3] = fx < hx
+            obs[:, 4] = fx > hx
+            obs[:, 5] = fy < hy
+            obs[:, 6] = fy > hy
+
+        obs[np.arange(m), DIR_COL[self._dirs]] = 1.0
+        obs[~self._alive] = 0.0
+        return obs
+
+    def _observations_small(self) -> np.ndarray:
+        # get_observations() for small M, filled as one flat list
+        grid, delta, stride = self._grid, self._delta_list, self._stride
+        food = [divmod(cell, stride) for cell in self._food]
+        obs = [0.0] * (11 * self.num_snakes)
+        for row, (head, tail, d, alive) in enumerate(zip(self._heads, self._tails, self._dirs, self._alive)):
+            if not alive:
+                continue
+            o = 11 * row
+            for k, turn in enumerate((d, (d - 1) % 4, (d + 1) % 4)):
+                cell = head + delta[turn]
+                occ = grid.item(cell)
+                # the own tail moves away if not eating (matches snake[:-1] in SnakeGame)
+                obs[o + k] = float(occ == WALL or (occ > 0 and cell != tail))
+            if food:
+                hy, hx = divmod(head, stride)
+                # first of the nearest, like np.argmin
+                fy, fx = food[0]
+                if len(food) > 1:
+                    fy, fx = min(food, key=lambda f: abs(hx - f[1]) + abs(hy - f[0]))
+                obs[o + 3], obs[o + 4] = float(fx < hx), float(fx > hx)
+                obs[o + 5], obs[o + 6] = float(fy < hy), float(fy > hy)
+            obs[o + DIR_COL_LIST[d]] = 1.0
+        return np.array(obs, dtype=np.float32).reshape(self.num_snakes, 11)
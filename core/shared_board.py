@@ -0,0 +1,127 @@
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+import numpy as np
+
+# Fixed-size shared-memory board used to spectate a training process.
+# The writer never blocks: it bumps a sequence counter to an odd value,
+# writes the board, then bumps it back to even (a seqlock). Readers copy
+# the board and retry if the counter moved or was odd while they read.
+#
+# layout: int64 header[8] | float64 epsilon | int16 body[width*height, 2]
+#   header = seq, width, height, length, food_x, food_y, score, episode
+
+DEFAULT_NAME = "snake_spectate"
+
+_HEADER_LEN = 8
+_EPS_OFFSET = _HEADER_LEN * 8
+_BODY_OFFSET = _EPS_OFFSET + 8
+
+
+def _region_size(width: int, height: int) -> int:
+    return _BODY_OFFSET + width * height * 2 * 2
+
+
+class _BoardView:
+    def __init__(self, shm: shared_memory.SharedMemory, max_cells: int):
+        self.shm = shm
+        self.header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=shm.buf, offset=0)
+        self.epsilon = np.ndarray((1,), dtype=np.float64, buffer=shm.buf, offset=_EPS_OFFSET)
+        self.body = np.ndarray((max_cells, 2), dtype=np.int16, buffer=shm.buf, offset=_BODY_OFFSET)
+
+    def release(self):
+        # numpy views pin the buffer; drop them before closing the mapping
+        del self.header, self.epsilon, self.body
+        self.shm.close()
+
+
+class BoardPublisher:
+    def __init__(self, width: int, height: int, name: str = DEFAULT_NAME):
+        size = _region_size(width, height)
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # could be a live run's board, so never tear it down here
+            raise FileExistsError(
+                f"A spectate board named {name!r} already exists. Another training run may be "
+                f"publishing under it; pick a different name, or remove /dev/shm/{name} if it "
+                f"was left behind by a crashed run."
+            ) from None
+
+        self.name = name
+        self._view = _BoardView(shm, width * height)
+        # seq 0 means nothing has been published yet
+        self._view.header[:] = 0
+        self._view.header[1] = width
+        self._view.header[2] = height
+
+    def publish(self, snake, food, score: int, episode: int, epsilon: float) -> None:
+        # convert outside the odd window so readers are locked out only for the copy
+        body = np.asarray(snake, dtype=np.int16)
+        n = len(body)
+
+        hdr = self._view.header
+        seq = int(hdr[0])
+        hdr[0] = seq + 1
+
+        self._view.body[:n] = body
+        hdr[3] = n
+        hdr[4], hdr[5] = food
+        hdr[6] = score
+        hdr[7] = episode
+        self._view.epsilon[0] = epsilon
+
+        hdr[0] = seq + 2
+
+    def close(self) -> None:
+        shm = self._view.shm
+        self._view.release()
+        shm.unlink()
+
+
+class BoardReader:
+    """
+    Read-only attachment to a BoardPublisher region. Raises FileNotFoundError
+    if no training process is publishing under `name`.
+    """
+    def __init__(self, name: str = DEFAULT_NAME):
+        shm = shared_memory.SharedMemory(name=name)
+        # attaching registers the segment with this process's resource tracker,
+        # which would unlink it on exit; the publisher owns its lifetime
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+        width, height = np.ndarray((3,), dtype=np.int64, buffer=shm.buf)[1:3]
+        self.width, self.height = int(width), int(height)
+        self._view = _BoardView(shm, self.width * self.height)
+        self._last_seq = -1
+
+    def snapshot(self, retries: int = 100) -> Optional[dict]:
+        """
+        Returns a consistent copy of the board, or None if nothing has been
+        published yet, it has not changed since the last call, or the writer
+        kept it busy for every retry.
+        """
+        hdr = self._view.header
+        for _ in range(retries):
+            seq = int(hdr[0])
+            if seq & 1:
+                continue
+            if seq == 0 or seq == self._last_seq:
+                return None
+
+            header = hdr.copy()
+            epsilon = float(self._view.epsilon[0])
+            body = self._view.body[: max(0, int(header[3]))].copy()
+
+            if int(hdr[0]) == seq and header[0] == seq:
+                self._last_seq = seq
+                return {
+                    "snake": [tuple(p) for p in body.tolist()],
+                    "food": (int(header[4]), int(header[5])),
+                    "score": int(header[6]),
+                    "episode": int(header[7]),
+                    "epsilon": epsilon,
+                }
+        return None
+
+    def close(self) -> None:
+        self._view.release()
@@ -19,12 +19,42 @@ class StepResult:
     score: int
     done: bool
     ate_food: bool
+    stalled: bool = False
 
 class SnakeGame:
-    def __init__(self, width: int = 20, height: int = 20, init_length: int = 3):
+    def __init__(
+        self,
+        width: int = 20,
+        height: int = 20,
+        init_length: int = 3,
+        detect_loops: bool = False,
+        starvation_factor: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        detect_loops: end the episode (stalled) when a (body, direction, food)
+            state repeats, i.e. a deterministic policy is cycling.
+        starvation_factor: end the episode (stalled) after
+            factor * (width*height + len(snake)) steps without eating. None = no budget.
+        seed: seeds this game's own food RNG. Games share no mutable state,
+            so separate instances can be stepped from separate threads.
+        """
         self.width = width
         self.height = height
         self.init_length = max(2, init_length)
+        self.detect_loops = detect_loops
+        self.starvation_factor = starvation_factor
+        self.rng = random.Random(seed)
+
+        # Zobrist keys, drawn from a private RNG so the food RNG is untouched
+        zrng = random.Random(0x5EED)
+        cells = width * height
+        self._z_body = [zrng.getrandbits(64) for _ in range(cells)]
+        self._z_head = [zrng.getrandbits(64) for _ in range(cells)]
+        self._z_food = [zrng.getrandbits(64) for _ in range(cells)]
+        self._z_dir = {d: zrng.getrandbits(64) for d in (UP, DOWN, LEFT, RIGHT)}
+        self._seen_cap = 4 * cells
+
         self.reset()
 
     def reset(self) -> StepResult:
@@ -33,12 +63,18 @@ class SnakeGame:
         self.snake: List[Pos] = [(cx - i, cy) for i in range(self.init_length)]
         self.score = 0
         self.done = False
+        self.stalled = False
+        self.steps_since_food = 0
+        self._body_hash = 0
+        for x, y in self.snake:
+            self._body_hash ^= self._z_body[x + y * self.width]
+        self._seen = set()
         self._spawn_food()
         return self._result(ate_food=False)
 
     def _spawn_food(self) -> None:
         empty = [(x, y) for x in range(self.width) for y in range(self.height) if (x, y) not in self.snake]
-        self.food = random.choice(empty) if empty else (-1, -1)
+        self.food = self.rng.choice(empty) if empty else (-1, -1)
 
     @staticmethod
     def _is_opposite(a: Dir, b: Dir) -> bool:
@@ -99,19 +135,58 @@ class SnakeGame:
             return self._result(ate_food=False)
 
         self.snake.insert(0, new_head)
+        self._body_hash ^= self._z_body[new_head[0] + new_head[1] * self.width]
 
         ate_food = (new_head == self.food)
         if ate_food:
             self.score += 1
+            self.steps_since_food = 0
+            # the snake just grew, so no earlier state can come back
+            self._seen.clear()
             self._spawn_food()
         else:
-            self.snake.pop()
+            tx, ty = self.snake.pop()
+            self._body_hash ^= self._z_body[tx + ty * self.width]
+            self.steps_since_food += 1
 
         if self.food == (-1, -1):
             self.done = True
+        elif not ate_food:
+            self._check_stall()
 
         return self._result(ate_food=ate_food)
 
+    def _state_hash(self) -> int:
+        hx, hy = self.snake[0]
+        fx, fy = self.food
+        return (
+            self._body_hash
+            ^ self._z_head[hx + hy * self.width]
+            ^ self._z_food[fx + fy * self.width]
+            ^ self._z_dir[self.direction]
+        )
+
+    def starvation_budget(self) -> Optional[int]:
+        if self.starvation_factor is None:
+            return None
+        return int(self.starvation_factor * (self.width * self.height + len(self.snake)))
+
+    def _check_stall(self) -> None:
+        budget = self.starvation_budget()
+        if budget is not None and self.steps_since_food >= budget:
+            self.stalled = True
+        elif self.detect_loops:
+            h = self._state_hash()
+            if h in self._seen:
+                self.stalled = True
+            else:
+                if len(self._seen) >= self._seen_cap:
+                    self._seen.clear()
+                self._seen.add(h)
+
+        if self.stalled:
+            self.done = True
+
     def _result(self, ate_food: bool) -> StepResult:
         return StepResult(
             snake=list(self.snake),
@@ -120,6 +195,7 @@ class SnakeGame:
             score=self.score,
             done=self.done,
             ate_food=ate_food,
+            stalled=self.stalled,
         )
 
     def get_observation(self) -> np.ndarray:
@@ -0,0 +1,226 @@
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from core.snake_game import SnakeGame
+
+# Headless renderer: paints boards into numpy frames with array writes only,
+# no display or SDL window, and streams them to PNG / GIF / video files.
+# Colours are copied from the pygame_app theme so pygame is not needed.
+
+EMPTY, FOOD_CELL, BODY_CELL, HEAD_CELL = range(4)
+
+# palette index = 2 * cell label + (1 on grid-line pixels)
+PALETTE = np.array(
+    [
+        (245, 245, 245), (235, 235, 235),  # BG, GRID
+        (220, 50, 50), (220, 50, 50),      # FOOD
+        (60, 180, 60), (60, 180, 60),      # BODY
+        (30, 120, 30), (30, 120, 30),      # HEAD
+    ],
+    dtype=np.uint8,
+)
+
+
+class Rasterizer:
+    """
+    Board -> (height*cell, width*cell) frame. Pixels are gathered from a
+    per-cell label grid through a precomputed pixel->cell index map, so a
+    frame costs one take() regardless of snake length.
+    """
+    def __init__(self, width: int = 20, height: int = 20, cell: int = 8, grid: bool = True):
+        self.width = width
+        self.height = height
+        self.cell = cell
+
+        ys = np.arange(height * cell) // cell
+        xs = np.arange(width * cell) // cell
+        self._pix_index = (ys[:, None] * width + xs[None, :]).astype(np.intp)
+
+        line = np.zeros(cell, dtype=np.uint8)
+        line[0] = 1 if grid and cell > 2 else 0
+        self._grid = np.tile(line, height)[:, None] | np.tile(line, width)[None, :]
+
+    def labels(self, snake, food) -> np.ndarray:
+        grid = np.zeros((self.height, self.width), dtype=np.uint8)
+        if food != (-1, -1):
+            grid[food[1], food[0]] = FOOD_CELL
+        if snake:
+            body = np.asarray(snake, dtype=np.intp)
+            grid[body[:, 1], body[:, 0]] = BODY_CELL
+            grid[body[0, 1], body[0, 0]] = HEAD_CELL
+        return grid
+
+    def indexed(self, labels: np.ndarray) -> np.ndarray:
+        """
+        labels: (h, w) or (n, h, w) -> PALETTE indices at pixel resolution.
+        """
+        flat = labels.reshape(labels.shape[:-2] + (-1,)) * 2
+        pix = flat.take(self._pix_index, axis=-1)
+        pix += self._grid
+        return pix
+
+    def rgb(self, labels: np.ndarray) -> np.ndarray:
+        return PALETTE.take(self.indexed(labels), axis=0)
+
+    def render(self, snake, food) -> np.ndarray:
+        return self.rgb(self.labels(snake, food))
+
+
+# ---------------- Episode playback ----------------
+def play_episode(policy, game: SnakeGame, max_steps: int = 100_000):
+    """
+    Yields (snake, food) for every board state of one greedy episode, including the first.
+    """
+    game.reset()
+    yield game.snake, game.food
+    steps = 0
+    while not game.done and steps < max_steps:
+        game.step_action(policy.act(game.get_observation()))
+        steps += 1
+        yield game.snake, game.food
+
+
+# ---------------- Encoders ----------------
+def write_png(path: str, frame: np.ndarray, palette: np.ndarray = None, level: int = 1) -> None:
+    """
+    frame: (h, w, 3) RGB, or (h, w) palette indices together with `palette`.
+    """
+    h, w = frame.shape[:2]
+    channels = 1 if frame.ndim == 2 else 3
+    raw = np.empty((h, w * channels + 1), dtype=np.uint8)
+    raw[:, 0] = 0  # filter type: none
+    raw[:, 1:] = frame.reshape(h, w * channels)
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        color_type = 3 if channels == 1 else 2
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, color_type, 0, 0, 0)))
+        if channels == 1:
+            f.write(chunk(b"PLTE", palette.astype(np.uint8).tobytes()))
+        f.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), level)))
+        f.write(chunk(b"IEND", b""))
+
+
+def write_png_sequence(out_dir: str, rasterizer: Rasterizer, boards) -> int:
+    os.makedirs(out_dir, exist_ok=True)
+    n = 0
+    for n, (snake, food) in enumerate(boards, start=1):
+        frame = rasterizer.indexed(rasterizer.labels(snake, food))
+        write_png(os.path.join(out_dir, f"frame_{n - 1:06d}.png"), frame, PALETTE)
+    return n
+
+
+def write_gif(path: str, rasterizer: Rasterizer, boards, fps: int = 28) -> int:
+    """
+    GIF stores frame delays in whole centiseconds, so the frame rate is
+    quantized: 28 fps is written as 40 ms/frame (25 fps).
+    """
+    try:
+        from PIL import GifImagePlugin, Image
+    except Exception as e:
+        raise RuntimeError(f"Pillow not available. Install pillow to write GIFs. ({e})")
+
+    # Image.save(save_all=True) holds every frame until the end, so the file is
+    # written one frame at a time with Pillow's GIF helpers instead: memory
+    # stays flat however long the episode is. Every frame shares PALETTE, so
+    # the global colour table is written once and frames need no local table.
+    palette = PALETTE.flatten().tolist()
+    duration = max(1, round(100 / fps)) * 10
+    n = 0
+    with open(path, "wb") as f:
+        for snake, food in boards:
+            # frames are already palette indices, so no quantization pass is needed
+            img = Image.fromarray(rasterizer.indexed(rasterizer.labels(snake, food)), mode="P")
+            img.putpalette(palette)
+            if n == 0:
+                header, _ = GifImagePlugin.getheader(img, info={"loop": 0, "duration": duration})
+                f.writelines(header)
+            f.writelines(GifImagePlugin.getdata(img, duration=duration))
+            n += 1
+        f.write(b";")  # trailer
+    return n
+
+
+def write_video(path: str, rasterizer: Rasterizer, boards, fps: int = 28) -> int:
+    try:
+        import imageio.v2 as imageio
+    except Exception as e:
+        raise RuntimeError(f"imageio not available. Install imageio[ffmpeg] to write video. ({e})")
+
+    n = 0
+    with imageio.get_writer(path, fps=fps, macro_block_size=1) as writer:
+        for snake, food in boards:
+            writer.append_data(rasterizer.render(snake, food))
+            n += 1
+    return n
+
+
+FORMATS = ("png", "gif", "mp4")
+
+
+def export_episode(policy_path: str, out_path: str, fmt: str = "gif", seed=None,
+                   cell: int = 8, fps: int = 28, max_steps: int = 100_000) -> dict:
+    from RL.numpy_policy import load_policy
+
+    policy = load_policy(policy_path)
+    game = SnakeGame(detect_loops=True, starvation_factor=1.0, seed=seed)
+    rasterizer = Rasterizer(game.width, game.height, cell=cell)
+    boards = play_episode(policy, game, max_steps)
+
+    if fmt == "png":
+        frames = write_png_sequence(out_path, rasterizer, boards)
+    elif fmt == "gif":
+        frames = write_gif(out_path, rasterizer, boards, fps)
+    elif fmt == "mp4":
+        frames = write_video(out_path, rasterizer, boards, fps)
+    else:
+        raise ValueError(f"fmt must be one of {FORMATS}, got {fmt!r}")
+    return {"path": out_path, "frames": frames, "score": game.score, "stalled": game.stalled}
+
+
+def export_episodes(policy_path: str, out_dir: str, num_episodes: int = 8, fmt: str = "gif",
+                    workers: int = None, seed: int = 0, **kwargs) -> list:
+    """
+    Plays and encodes episodes in parallel worker processes, one file (or PNG folder) each.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    ext = "" if fmt == "png" else f".{fmt}"
+    paths = [os.path.join(out_dir, f"episode_{i:03d}{ext}") for i in range(num_episodes)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(export_episode, policy_path, path, fmt, seed + i, **kwargs)
+            for i, path in enumerate(paths)
+        ]
+        return [f.result() for f in futures]
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render episodes of a trained policy to files, headless")
+    parser.add_argument("model", help=".npz weights or compiled table")
+    parser.add_argument("out_dir")
+    parser.add_argument("--episodes", type=int, default=4)
+    parser.add_argument("--format", choices=FORMATS, default="gif")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cell", type=int, default=8)
+    parser.add_argument("--fps", type=int, default=28)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = export_episodes(
+        args.model, args.out_dir, args.episodes, args.format, args.workers, args.seed, cell=args.cell, fps=args.fps
+    )
+    for r in results:
+        print(f"{r['path']} | Frames: {r['frames']} | Score: {r['score']}" + (" | Stalled" if r["stalled"] else ""))
+    print(f"Rendered {sum(r['frames'] for r in results)} frames in {time.perf_counter() - start:.1f}s")
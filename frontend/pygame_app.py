@@ -3,10 +3,10 @@ import glob
 import shutil
 import sys
 import subprocess
-import numpy as np
 import pygame
 
 from core.snake_game import SnakeGame, UP, DOWN, LEFT, RIGHT
+from core.shared_board import BoardReader, DEFAULT_NAME
 
 
 # ---------------- UI THEME ----------------
@@ -41,63 +41,6 @@ SPEED_LEVELS = [
 ]
 
 
-# ---------------- AI OBSERVATION ----------------
-# danger_ahead, danger_left, danger_right (3)
-# food_up, food_down, food_left, food_right (4)
-# dir_up, dir_down, dir_left, dir_right (4)
-def build_features(game: SnakeGame) -> np.ndarray:
-    snake = game.snake
-    (hx, hy) = snake[0]
-    dx, dy = game.direction
-    (fx, fy) = game.food
-
-    def collide(pos):
-        x, y = pos
-        if x < 0 or x >= game.width or y < 0 or y >= game.height:
-            return 1.0
-        if pos in snake:
-            return 1.0
-        return 0.0
-
-    left_dir = (dy, -dx)
-    right_dir = (-dy, dx)
-
-    ahead = (hx + dx, hy + dy)
-    left = (hx + left_dir[0], hy + left_dir[1])
-    right = (hx + right_dir[0], hy + right_dir[1])
-
-    danger_ahead = collide(ahead)
-    danger_left = collide(left)
-    danger_right = collide(right)
-
-    food_up = 1.0 if fy < hy else 0.0
-    food_down = 1.0 if fy > hy else 0.0
-    food_left = 1.0 if fx < hx else 0.0
-    food_right = 1.0 if fx > hx else 0.0
-
-    dir_up = 1.0 if (dx, dy) == (0, -1) else 0.0
-    dir_down = 1.0 if (dx, dy) == (0, 1) else 0.0
-    dir_left = 1.0 if (dx, dy) == (-1, 0) else 0.0
-    dir_right = 1.0 if (dx, dy) == (1, 0) else 0.0
-
-    return np.array(
-        [
-            danger_ahead,
-            danger_left,
-            danger_right,
-            food_up,
-            food_down,
-            food_left,
-            food_right,
-            dir_up,
-            dir_down,
-            dir_left,
-            dir_right,
-        ],
-        dtype=np.float32,
-    )
-
-
 # ---------------- Helpers ----------------
 def point_in_rect(pos, rect: pygame.Rect) -> bool:
     return rect.collidepoint(pos[0], pos[1])
@@ -115,6 +58,24 @@ def draw_text(screen, font, msg, x, y, color=TEXT):
     screen.blit(font.render(msg, True, color), (x, y))
 
 
+def draw_board(screen, snake, food, grid_w, grid_h, offset_y):
+    for x in range(grid_w + 1):
+        pygame.draw.line(screen, GRID, (x * CELL_SIZE, offset_y),
+                         (x * CELL_SIZE, offset_y + grid_h * CELL_SIZE))
+    for y in range(grid_h + 1):
+        pygame.draw.line(screen, GRID, (0, offset_y + y * CELL_SIZE),
+                         (grid_w * CELL_SIZE, offset_y + y * CELL_SIZE))
+
+    if food != (-1, -1):
+        fx, fy = food
+        food_rect = pygame.Rect(fx * CELL_SIZE, fy * CELL_SIZE + offset_y, CELL_SIZE, CELL_SIZE)
+        pygame.draw.rect(screen, FOOD, food_rect, border_radius=6)
+
+    for i, (x, y) in enumerate(snake):
+        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE + offset_y, CELL_SIZE, CELL_SIZE)
+        pygame.draw.rect(screen, HEAD if i == 0 else BODY, rect, border_radius=6)
+
+
 def pick_model_file():
     code = r"""
 import tkinter as tk
@@ -125,8 +86,9 @@ root.withdraw()
 root.attributes("-topmost", True)
 
 path = filedialog.askopenfilename(
-    title="Select AI model (.zip or .pth)",
-    filetypes=[("AI Model", "*.zip *.pth"), ("SB3 Model", "*.zip"), ("PyTorch Weights", "*.pth")]
+    title="Select AI model (.zip, .pth or .npz)",
+    filetypes=[("AI Model", "*.zip *.pth *.npz"), ("SB3 Model", "*.zip"), ("PyTorch Weights", "*.pth"),
+               ("NumPy Weights", "*.npz")]
 )
 
 try:
@@ -149,7 +111,9 @@ print(path if path else "")
 
 
 def load_models_list():
-    paths = glob.glob(os.path.join("models", "*.zip")) + glob.glob(os.path.join("models", "*.pth"))
+    paths = []
+    for ext in ("*.zip", "*.pth", "*.npz"):
+        paths += glob.glob(os.path.join("models", ext))
     paths.sort()
     return paths
 
@@ -204,7 +168,13 @@ def try_load_model(path: str):
 
         return TorchDQNWrapper(path)
 
-    raise RuntimeError("Unsupported model file. Use .zip or .pth")
+    # ---------- Case 3: exported numpy weights (no torch needed) ----------
+    if path.lower().endswith(".npz"):
+        from RL.numpy_policy import load_policy
+
+        return load_policy(path)
+
+    raise RuntimeError("Unsupported model file. Use .zip, .pth or .npz")
 
 
 # ---------------- Main App ----------------
@@ -277,11 +247,16 @@ def main():
 
     def start_human():
         nonlocal mode
+        game.detect_loops = False
+        game.starvation_factor = None
         reset_game()
         mode = "game_human"
 
     def start_ai():
         nonlocal mode, ai_model, ai_error, models
+        # a greedy model can cycle forever; end its game as "stalled" instead
+        game.detect_loops = True
+        game.starvation_factor = 1.0
         reset_game()
         ai_error = ""
         models = load_models_list()
@@ -367,7 +342,7 @@ def main():
                 # Drag & drop file
                 if event.type == pygame.DROPFILE:
                     dropped = event.file
-                    if dropped.lower().endswith((".zip", ".pth")):
+                    if dropped.lower().endswith((".zip", ".pth", ".npz")):
                         os.makedirs("models", exist_ok=True)
                         dest = os.path.join("models", os.path.basename(dropped))
                         try:
@@ -378,7 +353,7 @@ def main():
                         except Exception:
                             ai_error = "Upload failed"
                     else:
-                        ai_error = "Drop a .zip or .pth file"
+                        ai_error = "Drop a .zip, .pth or .npz file"
 
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_UP:
@@ -421,7 +396,8 @@ def main():
 
         elif mode == "game_ai":
             if not paused and not game.done:
-                obs = build_features(game)
+                # same 11-feature layout the RL/ agents are trained on
+                obs = game.get_observation()
                 action, _ = ai_model.predict(obs, deterministic=True)
                 st = game.step_action(int(action))
             else:
@@ -477,7 +453,7 @@ def main():
                                         upload_btn.centery - upload_txt.get_height() // 2))
 
                 # Hint + small inline error beside hint
-                hint = tiny.render("(or drag & drop .zip/.pth)", True, MUTED)
+                hint = tiny.render("(or drag & drop .zip/.pth/.npz)", True, MUTED)
                 hint_x = center_x - hint.get_width() // 2
                 hint_y = upload_btn.bottom + 6
                 screen.blit(hint, (hint_x, hint_y))
@@ -527,22 +503,7 @@ def main():
             draw_text(screen, small, "[R] Restart   [Space] Pause   [Esc] Menu", 10, 45, color=MUTED)
 
             offset_y = 90
-
-            for x in range(grid_w + 1):
-                pygame.draw.line(screen, GRID, (x * CELL_SIZE, offset_y),
-                                 (x * CELL_SIZE, offset_y + grid_h * CELL_SIZE))
-            for y in range(grid_h + 1):
-                pygame.draw.line(screen, GRID, (0, offset_y + y * CELL_SIZE),
-                                 (grid_w * CELL_SIZE, offset_y + y * CELL_SIZE))
-
-            if st.food != (-1, -1):
-                fx, fy = st.food
-                food_rect = pygame.Rect(fx * CELL_SIZE, fy * CELL_SIZE + offset_y, CELL_SIZE, CELL_SIZE)
-                pygame.draw.rect(screen, FOOD, food_rect, border_radius=6)
-
-            for i, (x, y) in enumerate(st.snake):
-                rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE + offset_y, CELL_SIZE, CELL_SIZE)
-                pygame.draw.rect(screen, HEAD if i == 0 else BODY, rect, border_radius=6)
+            draw_board(screen, st.snake, st.food, grid_w, grid_h, offset_y)
 
             if paused and not game.done:
                 draw_text(screen, font, "PAUSED", width_px // 2 - 55, 20)
@@ -551,7 +512,7 @@ def main():
                 overlay = pygame.Surface((width_px, grid_h * CELL_SIZE), pygame.SRCALPHA)
                 overlay.fill((0, 0, 0, 120))
                 screen.blit(overlay, (0, offset_y))
-                draw_text(screen, font, "GAME OVER", width_px // 2 - 75,
+                draw_text(screen, font, "STALLED" if game.stalled else "GAME OVER", width_px // 2 - 75,
                           offset_y + (grid_h * CELL_SIZE) // 2 - 30, color=(255, 255, 255))
                 draw_text(screen, small, "Press R to restart or Esc for menu",
                           width_px // 2 - 145, offset_y + (grid_h * CELL_SIZE) // 2 + 5, color=(255, 255, 255))
@@ -561,5 +522,65 @@ def main():
     pygame.quit()
 
 
+# ---------------- Spectate (live training view) ----------------
+def spectate(name: str = DEFAULT_NAME, fps: int = 30):
+    """
+    Attach read-only to the board a training run publishes (train(spectate=name))
+    and render it at our own frame rate. The learner is never waited on.
+    """
+    pygame.init()
+    grid_w, grid_h = 20, 20
+    reader = None
+
+    def attach():
+        nonlocal reader, grid_w, grid_h, screen
+        try:
+            reader = BoardReader(name)
+        except FileNotFoundError:
+            return
+        grid_w, grid_h = reader.width, reader.height
+        screen = pygame.display.set_mode((grid_w * CELL_SIZE, grid_h * CELL_SIZE + 90))
+
+    screen = pygame.display.set_mode((grid_w * CELL_SIZE, grid_h * CELL_SIZE + 90))
+    pygame.display.set_caption(f"AI Snake Game (Spectate: {name})")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("Arial", 22)
+    small = pygame.font.SysFont("Arial", 18)
+
+    board = None
+    running = True
+    while running:
+        clock.tick(fps)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        if reader is None:
+            attach()
+        if reader is not None:
+            board = reader.snapshot() or board
+
+        screen.fill(BG)
+        pygame.draw.rect(screen, BAR, (0, 0, grid_w * CELL_SIZE, 90))
+        if board is None:
+            draw_text(screen, font, "Waiting for training...", 10, 12)
+            draw_text(screen, small, f"Shared board: {name}   [Esc] Quit", 10, 45, color=MUTED)
+        else:
+            draw_text(screen, font,
+                      f"Score: {board['score']}   Episode: {board['episode']}   Epsilon: {board['epsilon']:.3f}",
+                      10, 12)
+            draw_text(screen, small, "Spectating training   [Esc] Quit", 10, 45, color=MUTED)
+            draw_board(screen, board["snake"], board["food"], grid_w, grid_h, 90)
+
+        pygame.display.flip()
+
+    if reader is not None:
+        reader.close()
+    pygame.quit()
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--spectate":
+        spectate(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_NAME)
+    else:
+        main()